@@ -1,10 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
-import csv
-import re
+import asyncio
+import aiohttp
+from lxml import etree
 import os
-import time
+import re
+import pickle
+import hashlib
+import json
+from functools import lru_cache
+import atexit
 from collections import Counter
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # 使用非交互式后端，避免GUI问题
 import matplotlib.pyplot as plt
@@ -15,13 +22,56 @@ try:
 except ImportError:
     print("提示: 未安装wordcloud库，将不会生成词云图。可通过'pip install wordcloud'安装。")
     WORDCLOUD_AVAILABLE = False
+try:
+    from aiohttp_client_cache import CachedSession
+    from aiohttp_client_cache.backends.sqlite import SQLiteBackend  # 依赖aiosqlite
+    AIOHTTP_CACHE_AVAILABLE = True
+except ImportError:
+    print("提示: 未安装aiohttp-client-cache库，每次运行都将重新爬取网页。可通过'pip install aiohttp-client-cache'安装。")
+    AIOHTTP_CACHE_AVAILABLE = False
+
+# 创建输出目录
+if not os.path.exists('output'):
+    os.makedirs('output')
+
+# 记录上次找到的中文字体路径，下次运行时直接使用
+FONT_CACHE_FILE = 'output/.font_cache.json'
+
+def _load_font_cache():
+    """读取缓存的字体路径，不存在或读取失败时返回None"""
+    try:
+        with open(FONT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('font_path')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _save_font_cache(font_path):
+    """保存找到的字体路径"""
+    try:
+        with open(FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'font_path': font_path}, f)
+    except OSError as e:
+        print(f"保存字体缓存时出错: {e}")
+
+def _use_font(font_path):
+    """将指定字体设置为matplotlib的默认字体"""
+    font_prop = FontProperties(fname=font_path)
+    plt.rcParams['font.family'] = font_prop.get_name()
+    print(f"已设置中文字体: {font_path}")
 
 # 设置中文字体支持
+@lru_cache(maxsize=1)
 def set_chinese_font():
     """设置中文字体，解决中文显示乱码问题"""
     try:
         # 尝试使用系统中的中文字体
         if os.name == 'nt':  # Windows系统
+            # 优先使用上次找到的字体，只需检查一次该文件是否仍然存在
+            cached_path = _load_font_cache()
+            if cached_path and os.path.exists(cached_path):
+                _use_font(cached_path)
+                return cached_path
+            
             font_paths = [
                 'C:/Windows/Fonts/simhei.ttf',  # 黑体
                 'C:/Windows/Fonts/simsun.ttc',  # 宋体
@@ -32,9 +82,8 @@ def set_chinese_font():
             # 检查字体是否存在并设置
             for font_path in font_paths:
                 if os.path.exists(font_path):
-                    font_prop = FontProperties(fname=font_path)
-                    plt.rcParams['font.family'] = font_prop.get_name()
-                    print(f"已设置中文字体: {font_path}")
+                    _use_font(font_path)
+                    _save_font_cache(font_path)
                     return font_path  # 返回字体路径供词云使用
                     
             # 如果以上字体都不存在，使用matplotlib内置的中文字体
@@ -56,148 +105,391 @@ def set_chinese_font():
 # 在程序开始时调用设置中文字体
 chinese_font_path = set_chinese_font()
 
-# 创建输出目录
-if not os.path.exists('output'):
-    os.makedirs('output')
+# 所有图表共用一个Figure，避免每次绘图都重新创建Figure，程序退出时再关闭
+_FIG = plt.figure()
+atexit.register(plt.close, _FIG)
+
+def _new_axes(figsize):
+    """清空共享的Figure并按指定尺寸返回新的坐标轴"""
+    _FIG.clear()
+    _FIG.set_size_inches(*figsize)
+    return _FIG.add_subplot(111)
 
 # 定义停用词
-STOP_WORDS = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
-              'which', 'this', 'that', 'these', 'those', 'then', 'just', 'so', 'than',
-              'such', 'both', 'through', 'about', 'for', 'is', 'of', 'while', 'during',
-              'to', 'from', 'in', 'on', 'by', 'with', 'without', 'at', 'between'}
+STOP_WORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
+                        'which', 'this', 'that', 'these', 'those', 'then', 'just', 'so', 'than',
+                        'such', 'both', 'through', 'about', 'for', 'is', 'of', 'while', 'during',
+                        'to', 'from', 'in', 'on', 'by', 'with', 'without', 'at', 'between'})
+
+# 关键词的最短长度，更短的词不计入词频
+MIN_KEYWORD_LENGTH = 3
+
+# 分词规则的版本号，修改_TRANS等不体现在停用词和最短长度中的规则时需加1，使保存的词频失效
+KEYWORDS_VERSION = 1
+
+class _CleanTable(dict):
+    """str.translate使用的转换表，一次遍历同时完成转小写和去除标点符号
+    
+    按先转小写再用正则[^\\w\\s]替换标点的规则处理。转小写可能得到多个字符
+    (如'İ'变为'i'加组合字符U+0307)，因此对转小写后的每个字符分别判断。
+    各字符的转换结果在首次遇到时计算并缓存。
+    
+    由于逐个字符转小写，与整个字符串调用lower()有一处有意的差异：希腊字母'Σ'
+    总是转为'σ'，不会按上下文在词尾转为'ς'，如'ΟΔΥΣΣΕΥΣ'得到'οδυσσευσ'而非'οδυσσευς'。
+    同一个词的大写和小写写法因此仍计为同一个关键词。
+    """
+    _PUNCT_RE = re.compile(r'[^\w\s]')
+
+    def __missing__(self, code):
+        value = self._PUNCT_RE.sub(' ', chr(code).lower())
+        self[code] = value
+        return value
+
+_TRANS = _CleanTable()
+
+# 标题数量达到该值时才使用可选的Numba加速路径(如合并多个会议分析时)
+# 每个进程首次调用需加载编译结果，约0.3秒，较小的语料用纯Python处理更快
+NUMBA_MIN_PAPERS = 100000
+
+# FNV-1a 64位哈希参数
+_FNV_OFFSET = 14695981039346656037
+_FNV_PRIME = 1099511628211
+
+def _fnv1a(data):
+    """计算字节串的FNV-1a 64位哈希，与Numba内核中的算法一致"""
+    h = _FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * _FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+# 排序后的停用词哈希，供Numba内核二分查找
+_STOP_HASHES = np.array(sorted(_fnv1a(word.encode('utf-8')) for word in STOP_WORDS), dtype=np.uint64)
+
+@lru_cache(maxsize=1)
+def _load_numba_kernel():
+    """首次使用加速路径时才导入Numba并编译内核，未安装Numba或编译失败时返回None
+    
+    内核在函数内部定义，Numba的类型和容器作为闭包变量使用，不修改模块全局变量。
+    字节判断直接写在内核中，只编译一个函数，使cache=True缓存的编译结果可以在之后的运行中复用。
+    """
+    try:
+        from numba import njit, types
+        from numba.typed import Dict
+    except ImportError:
+        return None
+    
+    @njit(cache=True)
+    def tokenize_count(buf, stop_hashes):
+        """遍历字节缓冲区分词计数，返回每个不同词首次出现的(起始位置<<32 | 长度)及其词频
+        
+        ASCII字母、数字、下划线以及UTF-8多字节字符均视为词的一部分。
+        """
+        counts = Dict.empty(key_type=types.uint64, value_type=types.int64)
+        spans = Dict.empty(key_type=types.uint64, value_type=types.int64)
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            # 跳过分隔符
+            while i < n:
+                c = buf[i]
+                if (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95 or c >= 128:
+                    break
+                i += 1
+            start = i
+            h = np.uint64(_FNV_OFFSET)
+            while i < n:
+                c = buf[i]
+                if not ((48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95 or c >= 128):
+                    break
+                if 65 <= c <= 90:  # ASCII大写转小写
+                    c += 32
+                h = (h ^ np.uint64(c)) * np.uint64(_FNV_PRIME)
+                i += 1
+            length = i - start
+            if length < MIN_KEYWORD_LENGTH:
+                continue
+            # 二分查找，跳过停用词
+            j = np.searchsorted(stop_hashes, h)
+            if j < stop_hashes.shape[0] and stop_hashes[j] == h:
+                continue
+            if h in counts:
+                counts[h] += 1
+            else:
+                counts[h] = 1
+                spans[h] = (start << 32) | length
+        
+        # 转为数组返回，避免在Python侧逐项访问typed.Dict
+        out_spans = np.empty(len(counts), dtype=np.int64)
+        out_counts = np.empty(len(counts), dtype=np.int64)
+        k = 0
+        for h in counts:
+            out_spans[k] = spans[h]
+            out_counts[k] = counts[h]
+            k += 1
+        return out_spans, out_counts
+    
+    # Numba在首次调用时才编译，此处先用一小段数据调用，编译出错时直接改用纯Python实现
+    try:
+        tokenize_count(np.frombuffer(b'numba kernel', dtype=np.uint8), _STOP_HASHES)
+    except Exception as e:
+        print(f"编译Numba加速内核时出错，将使用纯Python实现: {e}")
+        return None
+    return tokenize_count
+
+def _extract_keywords_numba(kernel, titles):
+    """extract_keywords的Numba加速实现，结果与纯Python实现一致"""
+    data = '\n'.join(titles).encode('utf-8')
+    spans, counts = kernel(np.frombuffer(data, dtype=np.uint8), _STOP_HASHES)
+    
+    # 在Python侧按词表(而非全部词)还原词语，并按纯Python实现的规则重新清理，
+    # 处理非ASCII大小写和非ASCII标点等Numba路径中未处理的情况
+    word_freq = Counter()
+    for span, count in zip(spans.tolist(), counts.tolist()):
+        start, length = span >> 32, span & 0xFFFFFFFF
+        token = data[start:start + length].decode('utf-8', errors='ignore')
+        for word in token.translate(_TRANS).split():
+            if len(word) >= MIN_KEYWORD_LENGTH and word not in STOP_WORDS:
+                word_freq[word] += count
+    return word_freq
+
+# 论文信息的字段，同时也是CSV文件的列
+PAPER_FIELDS = ['title', 'authors', 'year', 'conference', 'link']
 
 # 定义会议配置
 CONFERENCE_CONFIGS = {
     'aaai': {
         'name': 'AAAI',
-        'url_pattern': 'https://dblp.org/db/conf/aaai/aaai{year}.html',
+        'url_pattern': 'https://dblp.org/db/conf/aaai/aaai{year}.xml',
         'start_year': 2020,
         'end_year': 2025
     },
     'cvpr': {
         'name': 'CVPR',
-        'url_pattern': 'https://dblp.org/db/conf/cvpr/cvpr{year}.html',
+        'url_pattern': 'https://dblp.org/db/conf/cvpr/cvpr{year}.xml',
         'start_year': 2020,
         'end_year': 2024
     },
     'iccv': {
         'name': 'ICCV',
-        'url_pattern': 'https://dblp.org/db/conf/iccv/iccv{year}.html',
+        'url_pattern': 'https://dblp.org/db/conf/iccv/iccv{year}.xml',
         'start_year': 2019,  # ICCV是双年会议
         'end_year': 2023
     }
 }
 
+# 同时进行的请求数，避免请求过于频繁
+MAX_CONCURRENT_REQUESTS = 2
+# 每次真正访问网络后，占用的并发名额继续等待的时间(秒)
+REQUEST_INTERVAL = 1.0
+
+# 流式读取响应时每次交给解析器的字节数
+CHUNK_SIZE = 64 * 1024
+
+# 网页缓存有效期，往届论文列表不会变化；当年的列表可能仍在更新，缓存时间较短
+CACHE_EXPIRE_AFTER = timedelta(days=7)
+CURRENT_YEAR_EXPIRE_AFTER = 3600
+
+def create_session():
+    """创建所有请求共享的会话，复用keep-alive连接
+    
+    若安装了aiohttp-client-cache，则将网页缓存到本地，重复运行时命中缓存的请求不会访问网络。
+    """
+    kwargs = {
+        'connector': aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS),
+        'headers': {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate'  # 压缩传输，aiohttp会在读取时自动解压
+        },
+        'timeout': aiohttp.ClientTimeout(total=30)
+    }
+    if AIOHTTP_CACHE_AVAILABLE:
+        cache = SQLiteBackend('output/.dblp_aiohttp_cache', expire_after=CACHE_EXPIRE_AFTER)
+        return CachedSession(cache=cache, **kwargs)
+    return aiohttp.ClientSession(**kwargs)
+
+class DBLPTarget:
+    """lxml解析器的target对象，以事件方式只提取所需字段，不在内存中构建文档树
+    
+    只处理<inproceedings>记录内部的事件，页面标题、<proceedings>等其他记录直接忽略。
+    """
+    # 需要提取文本的字段
+    FIELDS = ('title', 'author', 'ee')
+
+    def __init__(self, conf_name, year):
+        self.conf_name = conf_name
+        self.year = str(year)
+        self.papers = []
+        self._record = None  # 当前所在的论文记录
+        self._field = None   # 当前正在提取的字段
+        self._buffer = []
+
+    def start(self, tag, attrib):
+        if self._record is None:
+            # 不在论文记录内时只需判断是否进入新记录
+            if tag == 'inproceedings':
+                self._record = {'key': attrib.get('key', ''), 'title': '', 'author': [], 'ee': []}
+        elif self._field is None and tag in self.FIELDS:
+            # 标题中可能嵌套<i>、<sub>等标签，其文本在字段结束前持续收集
+            self._field = tag
+            self._buffer = []
+
+    def data(self, text):
+        if self._field is not None:
+            self._buffer.append(text)
+
+    def end(self, tag):
+        if self._record is None:
+            return
+        if tag == self._field:
+            text = ''.join(self._buffer).strip()
+            if tag == 'title':
+                self._record['title'] = text
+            else:
+                self._record[tag].append(text)
+            self._field = None
+        elif tag == 'inproceedings':
+            self.papers.append(self._build_paper(self._record))
+            self._record = None
+
+    def close(self):
+        return self.papers
+
+    def _build_paper(self, record):
+        paper = {}
+        
+        # 提取标题
+        paper['title'] = record['title'] if record['title'] else '未知标题'
+        
+        # 提取作者
+        authors = [author for author in record['author'] if author]
+        paper['authors'] = '; '.join(authors) if authors else '未知作者'
+        
+        # 会议名称
+        paper['conference'] = self.conf_name
+        
+        # 年份
+        paper['year'] = self.year
+        
+        # 提取链接 优先使用doi.org链接，其次使用dblp.org/rec/详情页链接
+        doi_links = [ee for ee in record['ee'] if 'doi.org' in ee]
+        if doi_links:
+            paper['link'] = doi_links[0]
+        elif record['key']:
+            paper['link'] = f"https://dblp.org/rec/{record['key']}.html"
+        else:
+            paper['link'] = ''
+        
+        return paper
+
 # 1. 爬取会议论文信息
-def get_paper_info(conf_key, year):
+def conference_years(conf_key):
+    """返回指定会议需要爬取的年份"""
+    conf_config = CONFERENCE_CONFIGS[conf_key]
+    years = range(conf_config['start_year'], conf_config['end_year'] + 1)
+    # 对于ICCV，只处理奇数年份
+    return [year for year in years if not (conf_key == 'iccv' and year % 2 == 0)]
+
+def create_parser(conf_name, year):
+    """创建解析DBLP的XML目录的增量解析器，依次feed数据后由close()返回论文列表"""
+    # DBLP的XML目录与HTML页面包含相同的论文列表，但体积更小且结构清晰
+    # 使用target解析器按事件提取字段，整个过程中不构建文档树
+    return etree.XMLParser(target=DBLPTarget(conf_name, year), recover=True)
+
+async def fetch(session, semaphore, conf_key, year):
     """爬取指定会议和年份的论文信息"""
     conf_config = CONFERENCE_CONFIGS[conf_key]
     url = conf_config['url_pattern'].format(year=year)
-    print(f"正在爬取 {conf_config['name']} {year} 年论文...")
     
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()  # 检查请求是否成功
+        kwargs = {}
+        if (AIOHTTP_CACHE_AVAILABLE and isinstance(session, CachedSession)
+                and year >= datetime.now().year):
+            kwargs['expire_after'] = CURRENT_YEAR_EXPIRE_AFTER
         
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        papers = []
+        async with semaphore:
+            print(f"正在爬取 {conf_config['name']} {year} 年论文...")
+            async with session.get(url, **kwargs) as resp:
+                resp.raise_for_status()  # 检查请求是否成功
+                # 边接收边解析，不在内存中保留完整的响应内容
+                parser = create_parser(conf_config['name'], year)
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    parser.feed(chunk)
+                papers = parser.close()
+                from_cache = getattr(resp, 'from_cache', False)
+            if not from_cache:
+                await asyncio.sleep(REQUEST_INTERVAL)  # 避免请求过于频繁
         
-        # 查找所有论文条目
-        entries = soup.find_all('li', class_='entry inproceedings')
-        if not entries:
+        if not papers:
             print(f"警告: {conf_config['name']} {year}年未找到论文条目，请检查网页结构是否变化")
             return []
-            
-        for entry in entries:
-            paper = {}
-            
-            # 提取标题
-            title_tag = entry.find('span', class_='title')
-            paper['title'] = title_tag.text.strip() if title_tag else '未知标题'
-            
-            # 提取作者
-            authors = []
-            for author_tag in entry.find_all('span', itemprop='author'):
-                name_tag = author_tag.find('span', itemprop='name')
-                if name_tag:
-                    authors.append(name_tag.text.strip())
-            paper['authors'] = '; '.join(authors) if authors else '未知作者'
-            
-            # 会议名称
-            paper['conference'] = conf_config['name']
-            
-            # 年份
-            paper['year'] = str(year)
-            
-            # 提取链接 lambda用于检测是否存在doi.org或dblp.org/rec/
-            link = ''
-            doi_link = entry.find('a', href=lambda href: href and 'doi.org' in href)
-            if doi_link:
-                link = doi_link['href']
-            else:
-                details_link = entry.find('a', href=lambda href: href and 'dblp.org/rec/' in href)
-                if details_link:
-                    link = details_link['href']
-            paper['link'] = link
-            
-            papers.append(paper)
         
-        print(f"成功爬取 {len(papers)} 篇论文")
+        print(f"成功爬取 {conf_config['name']} {year} 年论文 {len(papers)} 篇")
         return papers
         
     except Exception as e:
         print(f"爬取 {conf_config['name']} {year} 年论文时出错: {e}")
         return []
 
-def save_to_csv(papers, filename):
+async def main_async():
+    """并发爬取所有会议所有年份的论文，返回按会议、年份排列的论文列表"""
+    tasks = [(conf_key, year) for conf_key in CONFERENCE_CONFIGS for year in conference_years(conf_key)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async with create_session() as session:
+        results = await asyncio.gather(*(fetch(session, semaphore, conf_key, year)
+                                         for conf_key, year in tasks))
+    
+    return [paper for papers in results for paper in papers]
+
+def save_to_csv(df, filename):
     """保存论文信息到CSV文件"""
-    if not papers:
+    if df.empty:
         print("没有论文数据可保存")
         return
         
     try:
-        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=['title', 'authors', 'year', 'conference', 'link'])#Dicwriter较于writer更适合结构化数据通过字典的键名直接映射到列名
-            writer.writeheader()
-            for paper in papers:
-                writer.writerow(paper)#按照每行写入论文数据
-        print(f"已保存 {len(papers)} 篇论文信息到 {filename}")
+        # 沿用csv模块的\r\n换行，与之前生成的文件保持一致
+        df.to_csv(filename, index=False, columns=PAPER_FIELDS, encoding='utf-8-sig', lineterminator='\r\n')
+        print(f"已保存 {len(df)} 篇论文信息到 {filename}")
     except Exception as e:
         print(f"保存CSV文件时出错: {e}")
 
+def save_to_parquet(df, filename):
+    """保存所有论文信息到Parquet文件，体积更小且读取更快，便于后续分析"""
+    try:
+        df.to_parquet(filename, index=False)
+        print(f"已保存 {len(df)} 篇论文信息到 {filename}")
+    except ImportError:
+        print("提示: 未安装pyarrow库，将不会保存Parquet文件。可通过'pip install pyarrow'安装。")
+    except Exception as e:
+        print(f"保存Parquet文件时出错: {e}")
+
 # 2. 统计每届会议论文数量并绘制趋势图
-def plot_paper_trend(papers, conf_name):
+def plot_paper_trend(year_count, conf_name):
     """绘制论文数量趋势图"""
-    if not papers:
+    if not year_count:
         print(f"没有 {conf_name} 论文数据可分析")
         return {}
         
-    # 按年份统计论文数量
-    year_count = {}
-    for paper in papers:
-        year = paper['year']
-        year_count[year] = year_count.get(year, 0) + 1
-    
     # 排序年份
     years = sorted(year_count.keys())
     counts = [year_count[year] for year in years]
     
     try:
         # 绘制趋势图
-        plt.figure(figsize=(10, 6))
-        plt.plot(years, counts, marker='o', linewidth=2)
-        plt.title(f'{conf_name}会议论文数量趋势', fontsize=14)
-        plt.xlabel('年份', fontsize=12)
-        plt.ylabel('论文数量', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
+        ax = _new_axes((10, 6))
+        ax.plot(years, counts, marker='o', linewidth=2)
+        ax.set_title(f'{conf_name}会议论文数量趋势', fontsize=14)
+        ax.set_xlabel('年份', fontsize=12)
+        ax.set_ylabel('论文数量', fontsize=12)
+        ax.grid(True, linestyle='--', alpha=0.7)
         
         # 添加数据标签
         for x, y in zip(years, counts):
-            plt.text(x, y+50, f"{y}", ha='center', va='bottom', fontsize=10)
+            ax.text(x, y+50, f"{y}", ha='center', va='bottom', fontsize=10)
             
-        plt.tight_layout()
-        plt.savefig(f'output/{conf_name.lower()}_paper_trend.png', dpi=300)
+        _FIG.tight_layout()
+        _FIG.savefig(f'output/{conf_name.lower()}_paper_trend.png', dpi=300)
         print(f"已保存论文数量趋势图到 output/{conf_name.lower()}_paper_trend.png")
         
         return year_count
@@ -206,30 +498,76 @@ def plot_paper_trend(papers, conf_name):
         return year_count
 
 # 3. 提取关键词并生成词云
-def extract_keywords(papers):
+def extract_keywords(titles):
     """从论文标题中提取关键词"""
-    if not papers:
+    if len(titles) == 0:
         print("没有论文数据可分析")
-        return {}
+        return Counter()
         
-    # 合并所有标题
-    all_titles = ' '.join([paper['title'] for paper in papers])
-    
-    # 清理文本
-    all_titles = all_titles.lower()
-    all_titles = re.sub(r'[^\w\s]', ' ', all_titles)  # 移除标点符号
-    
-    # 分词
-    words = all_titles.split()
+    # 大规模语料使用Numba加速路径
+    if len(titles) >= NUMBA_MIN_PAPERS:
+        kernel = _load_numba_kernel()
+        if kernel is not None:
+            try:
+                return _extract_keywords_numba(kernel, titles)
+            except Exception as e:
+                print(f"Numba加速路径出错，将使用纯Python实现: {e}")
     
-    # 移除停用词和短词
-    words = [word for word in words if word not in STOP_WORDS and len(word) > 2]
-    
-    # 统计词频
-    word_freq = Counter(words)
+    # 逐个标题清理、分词并累加词频，不再拼接所有标题或生成全部词的序列
+    word_freq = Counter()
+    for title in titles:
+        words = title.translate(_TRANS).split()
+        # 移除停用词和短词
+        word_freq.update(word for word in words if len(word) >= MIN_KEYWORD_LENGTH and word not in STOP_WORDS)
     
     return word_freq
 
+def keywords_digest(titles):
+    """计算所有标题及分词规则的摘要，用于判断保存的词频是否仍然有效
+    
+    停用词、最短长度或规则版本号变化时摘要随之变化，即使论文列表相同也会重新分词。
+    """
+    sha1 = hashlib.sha1()
+    sha1.update(repr((KEYWORDS_VERSION, MIN_KEYWORD_LENGTH, sorted(STOP_WORDS))).encode('utf-8'))
+    for title in titles:
+        sha1.update(title.encode('utf-8'))
+        sha1.update(b'\n')
+    return sha1.hexdigest()
+
+def load_keywords(conf_name, digest):
+    """读取保存的词频，摘要与digest不一致或读取失败时返回None"""
+    filename = f'output/{conf_name.lower()}_keywords.pkl'
+    if not os.path.exists(filename):
+        return None
+    try:
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+        if data.get('digest') == digest:
+            return data['word_freq']
+    except Exception as e:
+        print(f"读取关键词数据时出错: {e}")
+    return None
+
+def save_keywords(word_freq, conf_name, digest):
+    """保存词频及对应的摘要，论文列表和分词规则未变化时下次运行可直接读取，无需重新分词"""
+    filename = f'output/{conf_name.lower()}_keywords.pkl'
+    try:
+        with open(filename, 'wb') as f:
+            pickle.dump({'digest': digest, 'word_freq': word_freq}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"已保存关键词数据到 {filename}")
+    except Exception as e:
+        print(f"保存关键词数据时出错: {e}")
+
+def remove_keywords(conf_name):
+    """删除保存的关键词数据"""
+    filename = f'output/{conf_name.lower()}_keywords.pkl'
+    try:
+        if os.path.exists(filename):
+            os.remove(filename)
+            print(f"已删除过期的关键词数据 {filename}")
+    except OSError as e:
+        print(f"删除关键词数据时出错: {e}")
+
 def plot_keywords_bar(word_freq, conf_name, top_n=20):
     """绘制关键词频率条形图"""
     if not word_freq:
@@ -242,14 +580,15 @@ def plot_keywords_bar(word_freq, conf_name, top_n=20):
         words, counts = zip(*top_words)
         
         # 绘制条形图
-        plt.figure(figsize=(12, 8))
-        plt.barh(range(len(words)), counts, align='center')
-        plt.yticks(range(len(words)), words)
-        plt.xlabel('频率', fontsize=12)
-        plt.ylabel('关键词', fontsize=12)
-        plt.title(f'{conf_name}论文标题高频关键词 (Top {top_n})', fontsize=14)
-        plt.tight_layout()
-        plt.savefig(f'output/{conf_name.lower()}_keywords_bar.png', dpi=300)
+        ax = _new_axes((12, 8))
+        ax.barh(range(len(words)), counts, align='center')
+        ax.set_yticks(range(len(words)))
+        ax.set_yticklabels(words)
+        ax.set_xlabel('频率', fontsize=12)
+        ax.set_ylabel('关键词', fontsize=12)
+        ax.set_title(f'{conf_name}论文标题高频关键词 (Top {top_n})', fontsize=14)
+        _FIG.tight_layout()
+        _FIG.savefig(f'output/{conf_name.lower()}_keywords_bar.png', dpi=300)
         print(f"已保存关键词频率图到 output/{conf_name.lower()}_keywords_bar.png")
         
         # 保存高频词到文本文件
@@ -266,6 +605,18 @@ def plot_keywords_bar(word_freq, conf_name, top_n=20):
     except Exception as e:
         print(f"绘制关键词图时出错: {e}")
 
+def _load_wordcloud_cache(cache_file, key):
+    """读取缓存的词云图像，缓存不存在、键值不一致或读取失败时返回None"""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with np.load(cache_file) as data:
+            if str(data['key']) == key:
+                return data['image']
+    except Exception as e:
+        print(f"读取词云缓存时出错: {e}")
+    return None
+
 def generate_wordcloud(word_freq, conf_name):
     """生成词云图"""
     try:
@@ -274,28 +625,36 @@ def generate_wordcloud(word_freq, conf_name):
             'width': 800, 
             'height': 400, 
             'background_color': 'white',
-            'max_words': 200,
-            'colormap': 'viridis',
-            'contour_width': 1,
-            'contour_color': 'steelblue'
+            'max_words': 100,  # 条形图已展示前20个高频词，词云无需过多的低频词
+            'prefer_horizontal': 1.0,  # 只横向排布，省去旋转摆放的尝试
+            'colormap': 'viridis'
         }
         
         # 如果有中文字体，设置字体
         if chinese_font_path and os.path.exists(chinese_font_path):
             wc_kwargs['font_path'] = chinese_font_path
             
-        wordcloud = WordCloud(**wc_kwargs)
-        
-        # 从词频生成词云
-        wordcloud.generate_from_frequencies(word_freq)
+        # 词频和参数都未变化时直接读取上次渲染的图像，跳过词云布局计算
+        # 每个会议只保留一个缓存文件，其中同时保存键值，未命中时覆盖
+        key = hashlib.sha1(repr((sorted(word_freq.items()), sorted(wc_kwargs.items()))).encode()).hexdigest()
+        cache_file = f'output/.wc_{conf_name.lower()}.npz'
+        image = _load_wordcloud_cache(cache_file, key)
+        if image is None:
+            wordcloud = WordCloud(**wc_kwargs)
+            
+            # 从词频生成词云
+            wordcloud.generate_from_frequencies(word_freq)
+            image = wordcloud.to_array()
+            np.savez(cache_file, key=key, image=image)
         
         # 绘制词云图
-        plt.figure(figsize=(10, 6))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
-        plt.title(f'{conf_name}论文标题词云', fontsize=16)
-        plt.tight_layout()
-        plt.savefig(f'output/{conf_name.lower()}_wordcloud.png', dpi=300)
+        ax = _new_axes((10, 6))
+        ax.imshow(image, interpolation='bilinear')
+        ax.axis('off')
+        ax.set_title(f'{conf_name}论文标题词云', fontsize=16)
+        _FIG.tight_layout()
+        # 词云本身是800x400的位图，更高的dpi只会得到更大的文件
+        _FIG.savefig(f'output/{conf_name.lower()}_wordcloud.png', dpi=150)
         print(f"已保存词云图到 output/{conf_name.lower()}_wordcloud.png")
     except Exception as e:
         print(f"生成词云图时出错: {e}")
@@ -308,28 +667,25 @@ def predict_next_year(year_count, conf_name):
         return
         
     try:
-        # 转换为数值列表
-        years = sorted([int(y) for y in year_count.keys()])
-        counts = [year_count[str(y)] for y in years]
+        # 转换为数值数组
+        years = np.array(sorted(int(y) for y in year_count.keys()))
+        counts = np.array([year_count[str(y)] for y in years], dtype=np.float64)
         
-        # 计算年增长率
-        growth_rates = []
-        for i in range(1, len(counts)):
-            if counts[i-1] > 0:  # 避免除零错误
-                growth_rate = (counts[i] - counts[i-1]) / counts[i-1]
-                growth_rates.append(growth_rate)
+        # 计算年增长率 前一年论文数为0时跳过，避免除零错误
+        valid = counts[:-1] > 0
+        growth_rates = np.divide(np.diff(counts), counts[:-1],
+                                 out=np.zeros(len(counts) - 1), where=valid)[valid]
+        # 每个增长率对应的起止年份
+        rate_years = np.column_stack((years[:-1], years[1:]))[valid]
         
+        next_year = int(years[-1]) + 1
         # 如果没有足够的增长率数据，使用平均值
-        if not growth_rates:
-            avg_count = sum(counts) / len(counts)
-            next_year = years[-1] + 1
-            prediction = int(avg_count)
+        if growth_rates.size == 0:
+            prediction = int(counts.mean())
         else:
             # 使用平均增长率预测
-            avg_growth_rate = sum(growth_rates) / len(growth_rates)
-            next_count = counts[-1] * (1 + avg_growth_rate)
-            next_year = years[-1] + 1
-            prediction = int(next_count)
+            avg_growth_rate = growth_rates.mean()
+            prediction = int(counts[-1] * (1 + avg_growth_rate))
         
         print(f"预测 {conf_name} {next_year} 年论文数量: {prediction}")
         
@@ -338,65 +694,92 @@ def predict_next_year(year_count, conf_name):
             f.write(f"{conf_name} {next_year} 年论文数量预测: {prediction}\n")
             f.write("\n历年论文数量:\n")
             for y, c in zip(years, counts):
-                f.write(f"{y}: {c}\n")
-            if growth_rates:
+                f.write(f"{y}: {int(c)}\n")
+            if growth_rates.size:
                 f.write("\n历年增长率:\n")
-                for i, rate in enumerate(growth_rates):
-                    f.write(f"{years[i]} 至 {years[i+1]}: {rate:.2%}\n")
+                for (start, end), rate in zip(rate_years, growth_rates):
+                    f.write(f"{start} 至 {end}: {rate:.2%}\n")
                 f.write(f"\n平均增长率: {avg_growth_rate:.2%}\n")
         
         print(f"已保存预测结果到 output/{conf_name.lower()}_prediction.txt")
     except Exception as e:
         print(f"预测论文数量时出错: {e}")
 
-def process_conference(conf_key):
-    """处理单个会议的所有数据"""
+# 5. 汇总所有会议的关键词
+def compose_all(word_freqs, name='ALL'):
+    """将本次处理得到的各会议词频相加，绘制跨会议的关键词图"""
+    total = Counter()
+    for word_freq in word_freqs:
+        total += word_freq
+    
+    plot_keywords_bar(total, name)
+    return total
+
+def process_conference(conf_key, df, year_counts):
+    """处理单个会议的所有数据，返回该会议的关键词词频，没有论文数据时返回None
+    
+    df为所有会议的论文信息，year_counts为按(会议, 年份)统计的论文数量。
+    """
     conf_config = CONFERENCE_CONFIGS[conf_key]
     conf_name = conf_config['name']
     start_year = conf_config['start_year']
     end_year = conf_config['end_year']
     
-    print(f"\n开始爬取{conf_name}会议论文信息 ({start_year}-{end_year})...")
+    print(f"\n开始分析{conf_name}会议论文信息 ({start_year}-{end_year})...")
     
-    # 爬取论文
-    all_papers = []
-    for year in range(start_year, end_year + 1):
-        # 对于ICCV，只处理奇数年份
-        if conf_key == 'iccv' and year % 2 == 0:
-            continue
-        
-        # 爬取当前年份的论文
-        papers = get_paper_info(conf_key, year)
-        all_papers.extend(papers)
-        time.sleep(2)  # 避免请求过于频繁
-    
-    if not all_papers:
+    conf_df = df[df['conference'] == conf_name]
+    if conf_df.empty:
         print(f"未能获取任何{conf_name}论文信息，跳过该会议")
-        return
+        # 删除上次运行保存的关键词数据，避免被误当作本次结果使用
+        remove_keywords(conf_name)
+        return None
     
     # 保存所有论文信息
-    save_to_csv(all_papers, f'output/{conf_name.lower()}_papers_{start_year}_{end_year}.csv')
+    save_to_csv(conf_df, f'output/{conf_name.lower()}_papers_{start_year}_{end_year}.csv')
     
-    # 统计论文数量并绘制趋势图
-    year_count = plot_paper_trend(all_papers, conf_name)
+    # 绘制论文数量趋势图
+    year_count = plot_paper_trend(year_counts.loc[conf_name].to_dict(), conf_name)
     
     # 提取关键词并可视化
-    word_freq = extract_keywords(all_papers)
+    # 论文列表和分词规则与上次运行相同时直接使用保存的词频，跳过分词
+    digest = keywords_digest(conf_df['title'])
+    word_freq = load_keywords(conf_name, digest)
+    if word_freq is None:
+        word_freq = extract_keywords(conf_df['title'])
+        save_keywords(word_freq, conf_name, digest)
+    else:
+        print(f"{conf_name}论文列表和分词规则未变化，使用已保存的关键词数据")
     plot_keywords_bar(word_freq, conf_name)
     
     # 预测下一届论文数量
     predict_next_year(year_count, conf_name)
     
     print(f"{conf_name}会议数据处理完成！")
+    return word_freq
 
 def main():
     """主函数"""
     print("DBLP会议论文爬取与分析工具")
     print("="*50)
     
+    # 并发爬取所有配置的会议
+    print("\n开始爬取所有会议论文信息...")
+    df = pd.DataFrame(asyncio.run(main_async()), columns=PAPER_FIELDS)
+    save_to_parquet(df, 'output/papers.parquet')
+    
+    # 一次分组统计所有会议每年的论文数量
+    year_counts = df.groupby(['conference', 'year']).size()
+    
     # 处理所有配置的会议
+    word_freqs = []
     for conf_key in CONFERENCE_CONFIGS:
-        process_conference(conf_key)
+        word_freq = process_conference(conf_key, df, year_counts)
+        if word_freq is not None:
+            word_freqs.append(word_freq)
+    
+    # 汇总所有会议的关键词
+    print("\n开始汇总所有会议关键词...")
+    compose_all(word_freqs)
     
     print("\n所有会议数据处理完成！")
 